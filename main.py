@@ -1,8 +1,12 @@
 import argparse
-from collections import defaultdict
+import csv
+from itertools import chain, islice
 from dataclasses import dataclass
+from functools import cached_property
 import json
-from typing import List
+import operator
+from types import MappingProxyType
+from typing import Iterable, Iterator, List, Optional
 
 
 @dataclass
@@ -17,8 +21,14 @@ class Record:
         name (str): The hero's real name.
         hours (int): Time served, in hours.
         rate (int): The price of one hour of their existence.
+
+    Notes:
+        Base fields live in slots. __dict__ is kept so reports can still hang extra fields
+        (like payout) on a record, it only gets allocated once such a field shows up.
     """
 
+    __slots__ = ("employee_id", "department", "email", "name", "hours", "rate", "__dict__")
+
     employee_id: int
     department: str
     email: str
@@ -47,6 +57,12 @@ class Record:
         Returns:
             int or float or the fallback thing.
         """
+        if type(value) is int:
+            return value
+
+        if type(value) is float:
+            return int(value) if value.is_integer() else value
+
         try:
             number = float(value)
             return int(number) if number.is_integer() else number
@@ -60,15 +76,21 @@ class Group:
     Groups a bunch of Records by some shared identity — like a department.
     Can also inject magic fields via add_* methods, because static reports are boring.
 
+    Notes:
+        Groups built by Report.process get their total_* add-ons precomputed while records are grouped,
+        so add_total isn't called for them. Overriding add_total only affects groups built by hand
+        or add-ons passed without a precomputed value.
+
     Attributes:
         name (str): The group label (e.g. department name).
         records (list): The poor souls in this group.
         addons (list): Tuple of method names and field names to auto-calculate cool stuff.
     """
 
-    def __init__(self, name: str, records: List[Record], addons: tuple):
+    def __init__(self, name: str, records: List[Record], addons: tuple, precomputed: Optional[dict] = None):
         """
         Initializes a Group and applies all the optional spicy add-ons.
+        Add-ons already listed in precomputed (e.g. {"total_hours": 42}) are taken as is, no recalculation.
 
         Raises:
             AttributeError: If an expected add_* method is missing.
@@ -77,15 +99,22 @@ class Group:
         self.records = records
         self.addons = addons
 
+        precomputed = precomputed or {}
+
         for method, field in addons:
-            method_name = f"add_{method}"
+            addon_name = f"{method}_{field}"
+
+            if addon_name in precomputed:
+                setattr(self, addon_name, precomputed[addon_name])
+                continue
 
-            if hasattr(self, method_name):
-                setattr(self, f"{method}_{field}", getattr(self, method_name)(field))
+            add_method = getattr(type(self), f"add_{method}", None)
 
-            else:
+            if add_method is None:
                 raise AttributeError(f"Tried to call add_{method}, but that method ghosted us.")
 
+            setattr(self, addon_name, add_method(self, field))
+
     def __repr__(self) -> str:
         """Returns a quick preview of the group for nosy print statements."""
         return f"Group(name={self.name}, records={self.records})"
@@ -100,7 +129,7 @@ class Group:
         Returns:
             int or float: Total value of the field across records.
         """
-        return sum(getattr(record, field) for record in self.records)
+        return sum(map(operator.attrgetter(field), self.records))
 
 
 @dataclass
@@ -124,6 +153,7 @@ class Report:
         groupby (str): Attribute to group records by. Like 'department' or 'blood type'.
         addons (tuple): Extra summary fields to add via add_* methods.
         include (list): Which fields to show in the final output. Defaults to all the usual suspects.
+        chunk_size (int): Feed add_* methods this many records at a time. None (default) means all of them at once.
 
     Notes:
         To add a field into a report simply list it inside the include var like:
@@ -135,6 +165,10 @@ class Report:
                 for record in records:
                     record.custom_field = "Hey! Sup?"
 
+        By default add_* methods get every record in a single call. Setting chunk_size streams records through
+        them in chunks of that size instead — only do it if your fields don't need the whole dataset (no ranks,
+        no shares of a total, etc.).
+
         Fields are added in the same order they appear in include list.
         Hence, if you need to add field_1 and then field_2 that includes field_1 in it's calculations
         - field_1 should appear before field_2 in the include list.
@@ -146,6 +180,34 @@ class Report:
     addons = ()
 
     include = ["department", "email", "name", "hours", "rate"]
+    chunk_size = None
+
+    _BASE_FIELDS = frozenset(("employee_id", "department", "email", "name", "hours", "rate"))
+
+    @cached_property
+    def _field_adders(self) -> list:
+        """
+        Resolves the add_* methods for every non-base field in `include`, once per report.
+
+        Returns:
+            list: Bound add_* methods, in the same order as their fields appear in `include`.
+
+        Raises:
+            AttributeError: When you promise a field but forget to implement it.
+        """
+        adders = []
+
+        for field in self.include:
+            if field not in self._BASE_FIELDS:
+                method_name = f"add_{field}"
+                add_method = getattr(self, method_name, None)
+
+                if add_method is None:
+                    raise AttributeError(f"'{field}' is missing and there's no '{method_name}' method to save the day.")
+
+                adders.append(add_method)
+
+        return adders
 
     def add_fields(self, records: List[Record]) -> None:
         """
@@ -158,42 +220,79 @@ class Report:
         Raises:
             AttributeError: When you promise a field but forget to implement it.
         """
-        for field in self.include:
-            if field not in ["employee_id", "department", "email", "name", "hours", "rate"]:
-                method_name = f"add_{field}"
+        for add_method in self._field_adders:
+            add_method(records)
 
-                if hasattr(self, method_name):
-                    getattr(self, method_name)(records)
+    def stream_fields(self, records: Iterable[Record]) -> Iterator[Record]:
+        """
+        Passes records through add_fields on their way to grouping.
+        All of them at once by default, or chunk by chunk if chunk_size is set.
 
-                else:
-                    raise AttributeError(f"'{field}' is missing and there's no '{method_name}' method to save the day.")
+        Args:
+            records (Iterable[Record]): Any iterable of records, a lazy one is fine.
 
-    def process(self, records: List[Record]) -> List[Group]:
+        Yields:
+            Record: The same records, now with all the extra fields attached.
+
+        Raises:
+            AttributeError: When you promise a field but forget to implement it.
+        """
+        if self.chunk_size is None:
+            records = list(records)
+            self.add_fields(records)
+            yield from records
+            return
+
+        records = iter(records)
+
+        while chunk := list(islice(records, self.chunk_size)):
+            self.add_fields(chunk)
+            yield from chunk
+
+    def process(self, records: Iterable[Record]) -> List[Group]:
         """
         Groups the records into bundles of joy — or just departments.
+        Every ("total", field) add-on is summed up on the fly while grouping and handed to Group as precomputed,
+        so Group.add_total isn't called for those. Other add-ons still go through their add_* methods.
 
         Args:
-            records (List[Record]): The raw material.
+            records (Iterable[Record]): The raw material, walked through exactly once.
 
         Returns:
             List[Group]: Grouped records with optional add-ons.
         """
-        grouped = defaultdict(list)
-        [grouped[getattr(record, self.groupby)].append(record) for record in records]
-        return [Group(key, value, self.addons) for key, value in grouped.items()]
+        totals = [
+            (f"{method}_{field}", operator.attrgetter(field)) for method, field in self.addons if method == "total"
+        ]
+        grouped = {}
+
+        for record in records:
+            key = getattr(record, self.groupby)
+            bucket = grouped.get(key)
 
-    def create(self, records: List[Record]) -> Review:
+            if bucket is None:
+                grouped[key] = bucket = ([], {name: 0 for name, _ in totals})
+
+            bucket[0].append(record)
+            sums = bucket[1]
+
+            for name, getter in totals:
+                sums[name] += getter(record)
+
+        return [Group(key, value, self.addons, precomputed=sums) for key, (value, sums) in grouped.items()]
+
+    def create(self, records: Iterable[Record]) -> Review:
         """
         Generates a shiny Review object from raw records.
+        Extra fields are added through add_fields, then the records are grouped in a single pass.
 
         Args:
-            records (List[Record]): Input data.
+            records (Iterable[Record]): Input data, a list or a lazy stream of records.
 
         Returns:
             Review: The final packaged report.
         """
-        self.add_fields(records)
-        groups = self.process(records)
+        groups = self.process(self.stream_fields(records))
 
         return Review(groups=groups, fields=self.include)
 
@@ -244,19 +343,31 @@ class Formatter:
         Returns:
             str: A multi-line string that looks kinda like a spreadsheet.
         """
-        rows = [[""] + [header.capitalize() for header in review.fields]]
+        fields = review.fields
+        get_row = self._row_getter(fields)
+        field_index = {field: i for i, field in enumerate(fields)}
+
+        rows = []
+        widths = [0] * (len(fields) + 1)
+
+        def add_row(row):
+            cells = [str(cell) for cell in row]
+            widths[:] = map(max, widths, map(len, cells))
+            rows.append(cells)
+
+        add_row([""] + [header.capitalize() for header in fields])
 
         for group in review.groups:
-            rows.append([group.name] + ["" for _ in range(len(review.fields))])
+            add_row([group.name] + ["" for _ in range(len(fields))])
 
             for record in group.records:
-                rows.append([""] + [getattr(record, field) for field in review.fields])
+                add_row(["", *get_row(record)])
 
-            addons = {review.fields.index(addon[1]): getattr(group, "_".join(addon)) for addon in group.addons}
-            rows.append([""] + [addons.get(i, "") for i in range(len(review.fields))])
+            addons = {field_index[field]: getattr(group, f"{method}_{field}") for method, field in group.addons}
+            add_row([""] + [addons.get(i, "") for i in range(len(fields))])
 
-        widths = [max(len(str(cell)) for cell in column) for column in zip(*rows)]
-        lines = ["   ".join(str(cell).ljust(width) for cell, width in zip(row, widths)) for row in rows]
+        template = "   ".join(f"{{:<{width}}}" for width in widths)
+        lines = [template.format(*row) for row in rows]
 
         return "\n".join(lines)
 
@@ -270,17 +381,40 @@ class Formatter:
         Returns:
             dict: A nice little JSON-structured dictionary of your report data.
         """
+        fields = review.fields
+        get_row = self._row_getter(fields)
+
         def format_record(record):
-            return {field: getattr(record, field) for field in review.fields}
+            return dict(zip(fields, get_row(record)))
 
         formatted = {}
         for group in review.groups:
-            formatted[group.name] = {"records": [format_record(record) for record in group.records]}
-            addons = {"_".join(addon): getattr(group, "_".join(addon)) for addon in group.addons}
-            formatted[group.name] = {**formatted[group.name], **addons}
+            entry = {"records": [format_record(record) for record in group.records]}
+
+            for key in map("_".join, group.addons):
+                entry[key] = getattr(group, key)
+
+            formatted[group.name] = entry
 
         return formatted
 
+    @staticmethod
+    def _row_getter(fields: List[str]):
+        """
+        Builds a single callable that pulls all the fields out of a record at once.
+
+        Args:
+            fields (List[str]): Record attributes to fetch, in output order.
+
+        Returns:
+            Callable: Takes a record, returns a tuple of its values for the given fields.
+        """
+        if len(fields) > 1:
+            return operator.attrgetter(*fields)
+
+        getters = [operator.attrgetter(field) for field in fields]
+        return lambda record: tuple(getter(record) for getter in getters)
+
 
 class SaveToFile:
     """
@@ -290,6 +424,9 @@ class SaveToFile:
     Usage:
         SaveToFile("output", "json").save(review)
 
+    New save_as_* methods take the review plus an optional `formatted` payload,
+    so an already formatted report isn't built twice.
+
     Attributes:
         filepath (str): Where the file should go.
         fileformat (str): What magical format to save as (e.g., 'json', 'text').
@@ -308,40 +445,42 @@ class SaveToFile:
             AttributeError: If no save method exists for the given format.
         """
         self.filepath = filepath
-        method_name = f"save_as_{fileformat}"
+        save_method = getattr(type(self), f"save_as_{fileformat}", None)
 
-        if hasattr(self, method_name):
-            self.save = getattr(self, method_name)
-        else:
+        if save_method is None:
             raise AttributeError(f"Saving as '{fileformat}'? Forbidden magic. That format is not in the spellbook.")
 
+        self.save = save_method.__get__(self)
+
     def respond(self) -> None:
         print(f"Report was saved to '{self.filepath}'. You're welcome.")
 
-    def save_as_json(self, review: Review) -> None:
+    def save_as_json(self, review: Review, formatted: Optional[dict] = None) -> None:
         """
         Saves the formatted review data as a JSON file.
 
         Args:
             data (Review): The review to save.
+            formatted (dict): Output of Formatter().jsonfile(review), if you already have it (optional).
         """
         self.filepath += ".json" if not self.filepath.endswith(".json") else ""
-        formatted = Formatter().jsonfile(review)
+        formatted = Formatter().jsonfile(review) if formatted is None else formatted
 
         with open(self.filepath, "w") as file:
-            json.dump(formatted, file)
+            file.write(json.dumps(formatted))
 
         self.respond()
 
-    def save_as_text(self, review: Review) -> None:
+    def save_as_text(self, review: Review, formatted: Optional[str] = None) -> None:
         """
         Saves the formatted review as a plain text file — aligned and readable.
 
         Args:
             data (Review): The review to save.
+            formatted (str): Output of Formatter().console(review), if you already have it (optional).
         """
         self.filepath += ".txt" if not self.filepath.endswith(".txt") else ""
-        formatted = Formatter().console(review)
+        formatted = Formatter().console(review) if formatted is None else formatted
 
         with open(self.filepath, "w") as file:
             file.write(formatted)
@@ -395,36 +534,43 @@ def parse_args():
 
 
 columns = ["id", "department", "email", "name", "hours_worked", "hourly_rate", "rate", "salary"]
-reports_map = {
+reports_map = MappingProxyType({
     "payout": PayoutReport,
     # add new reports here, they'll be callable from console under -r/--report flag
-}
+})
 
 
-def load_records(filepath: str) -> List[Record]:
+def read_records(filepath: str) -> Iterator[Record]:
     """
-    Loads employee records from a CSV file.
+    Lazily reads employee records from a CSV file, one row at a time.
 
     Assumes the file has a header row with columns in any order.
     Automatically maps them to expected Record fields by position.
+    Whitespace around header names and cell values is stripped.
     If a column is missing or the structure is messed up, it'll complain loudly.
 
     Args:
         filepath (str): Path to the CSV file.
 
-    Returns:
-        List[Record]: List of Record instances loaded from the file.
+    Yields:
+        Record: Record instances, in file order.
 
     Raises:
         Exception: If something's wrong with the file (missing columns, bad format, etc.).
     """
 
     try:
-        with open(filepath, "r") as file:
-            lines = [line.strip().split(",") for line in file]
+        with open(filepath, "r", newline="", buffering=1 << 20) as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+
+            if header is None:
+                raise ValueError("The file is empty. Not even a header row to hold on to.")
+
+            order = [min(columns.index(column.strip()), 5) for column in header]
+            positions = [order.index(i) for i in range(len(order))]
 
-        order = [min(columns.index(column), 5) for column in lines[0]]
-        return [Record(*(data[order.index(i)] for i in range(len(order)))) for data in lines[1:]]
+            yield from (Record(*(data[j].strip() for j in positions)) for data in reader if data)
 
     except Exception as error:
         print(f"Failed to load file: {filepath}")
@@ -433,22 +579,59 @@ def load_records(filepath: str) -> List[Record]:
         raise
 
 
+def load_records(filepath: str) -> List[Record]:
+    """
+    Loads all employee records from a CSV file into a list. See read_records for the details.
+
+    Args:
+        filepath (str): Path to the CSV file.
+
+    Returns:
+        List[Record]: List of Record instances loaded from the file.
+
+    Raises:
+        Exception: If something's wrong with the file (missing columns, bad format, etc.).
+    """
+    return list(read_records(filepath))
+
+
+def read_all_records(filepaths: List[str]) -> Iterator[Record]:
+    """
+    Lazily reads records from all the given CSV files, in the order the files were passed.
+    Files are streamed one after another, row by row.
+
+    Args:
+        filepaths (List[str]): Paths to the CSV files.
+
+    Returns:
+        Iterator[Record]: Record instances from every file.
+
+    Raises:
+        Exception: If something's wrong with any of the files (missing columns, bad format, etc.).
+    """
+    return chain.from_iterable(read_records(filepath) for filepath in filepaths)
+
+
 def main():
     args = parse_args()
 
-    records = [record for file in args.files for record in load_records(file)]
     report = reports_map.get(args.report)
 
     if not report:
         exit(f"Unknown report type '{args.report}'. Try one of: {', '.join(reports_map.keys())}. Or don't.")
 
+    records = read_all_records(args.files)
+
     review = report().create(records)
+    console_output = None
 
     if not args.silent:
-        print(Formatter().console(review))
+        console_output = Formatter().console(review)
+        print(console_output)
 
     if args.output:
-        SaveToFile(args.output, args.format).save(review)
+        formatted = console_output if args.format == "text" else None
+        SaveToFile(args.output, args.format).save(review, formatted=formatted)
 
     if args.silent and not args.output:
         print("Warning: You used --silent without specifying --output. "
@@ -2,7 +2,7 @@ import sys
 
 import pytest
 
-from reports.main import parse_args, load_records, main
+from reports.main import parse_args, load_records, read_records, read_all_records, main
 
 
 # Sample CSV content
@@ -55,6 +55,66 @@ def test_load_records_parses_csv(tmp_path):
     assert records[1].hours == 5
 
 
+def test_read_records_is_lazy(tmp_path):
+    path = tmp_path / "test.csv"
+    path.write_text(SAMPLE_CSV)
+
+    records = read_records(str(path))
+    assert not isinstance(records, list)
+
+    first = next(records)
+    assert first.name == "Alice"
+    assert [record.name for record in records] == ["Bob"]
+
+
+def test_load_records_handles_crlf(tmp_path):
+    path = tmp_path / "windows.csv"
+    path.write_bytes(SAMPLE_CSV.replace("\n", "\r\n").encode())
+
+    records = load_records(str(path))
+    assert len(records) == 2
+    assert records[1].rate == 80
+
+
+def test_read_all_records_keeps_file_order(tmp_path):
+    first = tmp_path / "first.csv"
+    first.write_text(SAMPLE_CSV)
+    second = tmp_path / "second.csv"
+    second.write_text("id,department,email,name,hours_worked,rate\n3,Ops,ops@c.com,Carl,7,60\n")
+
+    records = list(read_all_records([str(first), str(second)]))
+    assert [record.name for record in records] == ["Alice", "Bob", "Carl"]
+    assert records[2].rate == 60
+
+
+def test_load_records_tolerates_header_whitespace(tmp_path):
+    path = tmp_path / "padded.csv"
+    path.write_text("id,department,email,name,hours_worked,rate \n1,Dev,dev@a.com,Alice,10,100\n")
+
+    records = load_records(str(path))
+    assert len(records) == 1
+    assert records[0].rate == 100
+
+
+def test_load_records_strips_padded_cells(tmp_path):
+    path = tmp_path / "padded_cells.csv"
+    path.write_text("department,id,email,hours_worked,rate,name\n Dev,1,dev@a.com,10,100,Al  \nDev,2,b@b.com,5,80,Bo\n")
+
+    records = load_records(str(path))
+    assert records[0].name == "Al"
+    assert records[0].department == records[1].department == "Dev"
+
+
+def test_load_records_empty_file_says_so(tmp_path, capsys):
+    path = tmp_path / "empty.csv"
+    path.write_text("")
+
+    with pytest.raises(ValueError, match="empty"):
+        load_records(str(path))
+
+    assert "Error: The file is empty" in capsys.readouterr().out
+
+
 def test_load_records_invalid_csv_throws(tmp_path):
     path = tmp_path / "bad.csv"
     path.write_text("completely,invalid,csv\none,line,only")
@@ -86,6 +146,44 @@ def test_main_text_output(tmp_path, monkeypatch, capsys):
     assert "Bob" in content
 
 
+def test_main_text_output_matches_console(tmp_path, monkeypatch, capsys):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(SAMPLE_CSV)
+
+    output_path = tmp_path / "out"
+    test_args = [
+        "prog",
+        str(csv_path),
+        "-r", "payout",
+        "-f", "text",
+        "-o", str(output_path),
+    ]
+    monkeypatch.setattr(sys, "argv", test_args)
+
+    main()
+
+    captured = capsys.readouterr()
+    content = output_path.with_suffix(".txt").read_text()
+    assert captured.out.startswith(content)
+
+
+def test_main_unknown_report_exits_before_loading(tmp_path, monkeypatch):
+    test_args = [
+        "prog",
+        str(tmp_path / "missing.csv"),
+        "-r", "nonsense",
+    ]
+    monkeypatch.setattr(sys, "argv", test_args)
+
+    def fail_read_all_records(filepaths):
+        raise AssertionError("input was set up before the report type was validated")
+
+    monkeypatch.setattr("reports.main.read_all_records", fail_read_all_records)
+
+    with pytest.raises(SystemExit, match="Unknown report type 'nonsense'"):
+        main()
+
+
 def test_main_warns_about_silent_without_output(tmp_path, monkeypatch, capsys):
     csv_path = tmp_path / "data.csv"
     csv_path.write_text(SAMPLE_CSV)
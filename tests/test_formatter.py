@@ -1,5 +1,5 @@
 import pytest
-from reports.main import Record, PayoutReport, Formatter
+from reports.main import Record, Group, Review, PayoutReport, Formatter
 
 
 @pytest.fixture
@@ -48,3 +48,15 @@ def test_json_output_respects_field_order(payout_review):
     fields = list(record.keys())
 
     assert fields == ["name", "hours", "rate", "payout"]
+
+
+def test_single_field_review():
+    records = [Record(1, "Dev", "dev1@work.com", "Alice", 5, 10)]
+    review = Review(groups=[Group("Dev", records, (("total", "hours"),))], fields=["hours"])
+
+    json_data = Formatter().jsonfile(review)
+    assert json_data["Dev"] == {"records": [{"hours": 5}], "total_hours": 5}
+
+    output = Formatter().console(review)
+    assert "Hours" in output
+    assert output.count("\n") == 3
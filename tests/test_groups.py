@@ -52,3 +52,19 @@ def test_missing_add_method_raises():
 
     with pytest.raises(AttributeError, match="add_fake"):
         Group("IT", records, addons=(("fake", "hours"),))
+
+
+def test_precomputed_addon_skips_calculation(sample_records):
+    group = Group("IT", sample_records, addons=(("total", "hours"),), precomputed={"total_hours": 1})
+
+    assert group.total_hours == 1
+
+
+def test_subclass_add_method_override_is_used(sample_records):
+    class NegativeGroup(Group):
+        def add_total(self, field):
+            return -1
+
+    group = NegativeGroup("IT", sample_records, addons=(("total", "hours"),))
+
+    assert group.total_hours == -1
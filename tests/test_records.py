@@ -1,3 +1,6 @@
+from decimal import Decimal
+from fractions import Fraction
+
 from reports.main import Record
 
 
@@ -51,3 +54,29 @@ def test_record_to_number_explicitly():
     assert Record._to_number("garbage") == "garbage"
     assert Record._to_number("") == ""
     assert Record._to_number("", default=0) == 0
+
+
+def test_record_to_number_keeps_numbers():
+    assert Record._to_number(5) == 5
+    assert Record._to_number(5.0) == 5
+    assert isinstance(Record._to_number(5.0), int)
+    assert Record._to_number(5.5) == 5.5
+    assert Record._to_number(True) == 1
+    assert type(Record._to_number(True)) is int
+
+
+def test_record_to_number_parses_integer_strings():
+    assert type(Record._to_number("160")) is int
+    assert Record._to_number("-0") == 0
+    assert Record._to_number("5.0") == 5
+    assert Record._to_number("1e3") == 1000
+
+
+def test_record_to_number_does_not_truncate_other_numbers():
+    class Hours(float):
+        pass
+
+    assert Record._to_number(Decimal("5.5")) == 5.5
+    assert Record._to_number(Fraction(11, 2)) == 5.5
+    assert Record._to_number(Hours(2.5)) == 2.5
+    assert Record._to_number("99999999999999999999") == int(float("99999999999999999999"))
@@ -44,3 +44,42 @@ def test_empty_data_gives_empty_groups():
     review = report.create([])
     assert review.groups == []
     assert review.fields == ["name", "hours", "rate", "payout"]
+
+
+def test_create_consumes_lazy_records_in_chunks(sample_records):
+    report = PayoutReport()
+    report.chunk_size = 2
+    review = report.create(iter(sample_records))
+
+    assert all(record.payout == record.hours * record.rate for record in sample_records)
+
+    finance_group = next(g for g in review.groups if g.name == "Finance")
+    assert finance_group.total_payout == 20 * 100
+
+
+def test_add_methods_see_all_records_by_default(sample_records):
+    class ShareReport(PayoutReport):
+        include = ["name", "hours", "rate", "payout", "share"]
+
+        def add_share(self, records):
+            total = sum(record.payout for record in records)
+            for record in records:
+                record.share = record.payout / total
+
+    ShareReport().create(iter(sample_records))
+
+    assert sum(record.share for record in sample_records) == pytest.approx(1)
+    assert sample_records[2].share == pytest.approx(2000 / 2700)
+
+
+def test_create_uses_overridden_add_fields(sample_records):
+    class LoggingReport(PayoutReport):
+        def add_fields(self, records):
+            self.seen = len(records)
+            super().add_fields(records)
+
+    report = LoggingReport()
+    report.create(sample_records)
+
+    assert report.seen == 3
+    assert sample_records[0].payout == 10 * 50
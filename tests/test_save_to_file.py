@@ -61,3 +61,27 @@ def test_auto_extension_text(tmp_path, payout_review):
     saver.save(payout_review)
 
     assert file_path.exists()
+
+
+def test_save_as_text_uses_preformatted_output(tmp_path, payout_review):
+    file_path = tmp_path / "summary"
+    SaveToFile(str(file_path), "text").save(payout_review, formatted="already formatted")
+
+    assert (tmp_path / "summary.txt").read_text() == "already formatted"
+
+
+def test_subclass_save_methods_are_used(tmp_path, payout_review):
+    class CustomSaver(SaveToFile):
+        def save_as_json(self, review, formatted=None):
+            self.saved = "custom json"
+
+        def save_as_csv(self, review, formatted=None):
+            self.saved = "custom csv"
+
+    json_saver = CustomSaver(str(tmp_path / "report"), "json")
+    json_saver.save(payout_review)
+    assert json_saver.saved == "custom json"
+
+    csv_saver = CustomSaver(str(tmp_path / "report"), "csv")
+    csv_saver.save(payout_review)
+    assert csv_saver.saved == "custom csv"